@@ -0,0 +1,74 @@
+"""
+Cache Helper Functions
+
+Redis helpers for caching serialized API responses. Caching is optional: when
+REDIS_URL is not set every lookup is a miss and writes are no-ops.
+"""
+
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+# Load environment variables from .env file
+load_dotenv()
+
+redis_client = None
+
+redis_url = os.getenv("REDIS_URL")
+
+if redis_url:
+    # Short timeouts so an unresponsive Redis degrades to a cache miss quickly
+    redis_client = aioredis.from_url(
+        redis_url,
+        socket_connect_timeout=0.2,
+        socket_timeout=0.2,
+    )
+
+
+def cache_enabled() -> bool:
+    """Whether a Redis client is configured"""
+    return redis_client is not None
+
+
+async def get_generation(namespace: str) -> int:
+    """Return the current generation for namespace, to be included in its cache keys"""
+    if redis_client is None:
+        return 0
+    try:
+        value = await redis_client.get(f"{namespace}:gen")
+    except RedisError:
+        return 0
+    return int(value) if value is not None else 0
+
+
+async def bump_generation(namespace: str):
+    """Invalidate every key built from namespace's current generation"""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.incr(f"{namespace}:gen")
+    except RedisError:
+        pass
+
+
+async def get_cached(key: str) -> Optional[bytes]:
+    """Return the cached payload for key, or None on a miss"""
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except RedisError:
+        return None
+
+
+async def set_cached(key: str, payload: bytes, ttl: int = 60):
+    """Store payload under key for ttl seconds"""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.setex(key, ttl, payload)
+    except RedisError:
+        pass
@@ -5,51 +5,113 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from datetime import datetime, timezone
+from functools import lru_cache
 import os
 from dotenv import load_dotenv
-from typing import Union
-from pydantic import BaseModel
+from typing import List, Optional, Union
+from pydantic import BaseModel, TypeAdapter
+
+from schemas import Booking, Property
 
 # Load environment variables from .env file
 load_dotenv()
 
-_client = None
-db = None
-
 database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
-if database_url and database_name:
-    _client = MongoClient(database_url)
-    db = _client[database_name]
+
+@lru_cache(maxsize=1)
+def get_client() -> Optional[AsyncIOMotorClient]:
+    """Return the process-wide Motor client, creating its pool on first use"""
+    if not (database_url and database_name):
+        return None
+    return AsyncIOMotorClient(
+        database_url,
+        maxPoolSize=50,
+        minPoolSize=10,
+        serverSelectionTimeoutMS=2000,
+        socketTimeoutMS=5000,
+    )
+
+
+def _get_database() -> Optional[AsyncIOMotorDatabase]:
+    client = get_client()
+    if client is None:
+        return None
+    return client[database_name]
+
+
+async def get_db() -> Optional[AsyncIOMotorDatabase]:
+    """FastAPI dependency returning the configured database, or None"""
+    # async so FastAPI resolves it on the event loop instead of the threadpool
+    return _get_database()
+
+
+# Adapters are built once and reused so each insert skips rebuilding the serializer
+_adapters = {
+    "property": TypeAdapter(Property),
+    "booking": TypeAdapter(Booking),
+}
+
+
+def _to_document(collection_name: str, data: Union[BaseModel, dict]) -> dict:
+    """Convert a model or dict into a plain dict ready for insertion"""
+    if not isinstance(data, BaseModel):
+        return data.copy()
+    adapter = _adapters.get(collection_name)
+    if adapter is None:
+        return data.model_dump(mode="json", by_alias=True)
+    return adapter.dump_python(data, mode="json", by_alias=True)
 
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
+async def create_document(collection_name: str, data: Union[BaseModel, dict], db: AsyncIOMotorDatabase = None):
     """Insert a single document with timestamp"""
+    db = db if db is not None else _get_database()
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
 
-    # Convert Pydantic model to dict if needed
-    if isinstance(data, BaseModel):
-        data_dict = data.model_dump()
-    else:
-        data_dict = data.copy()
+    data_dict = _to_document(collection_name, data)
 
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
 
-    result = db[collection_name].insert_one(data_dict)
+    result = await db[collection_name].insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+async def create_documents(collection_name: str, items: List[Union[BaseModel, dict]], db: AsyncIOMotorDatabase = None):
+    """Insert many documents with timestamps in a single round trip"""
+    db = db if db is not None else _get_database()
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    now = datetime.now(timezone.utc)
+    docs = []
+    for item in items:
+        data_dict = _to_document(collection_name, item)
+        data_dict['created_at'] = now
+        data_dict['updated_at'] = now
+        docs.append(data_dict)
+
+    result = await db[collection_name].insert_many(docs, ordered=False)
+    return len(result.inserted_ids)
+
+def find_documents(collection_name: str, filter_dict: dict = None, limit: int = None, sort: list = None, projection: dict = None, db: AsyncIOMotorDatabase = None):
+    """Get a cursor over documents from collection, for iterating with async for"""
+    db = db if db is not None else _get_database()
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
     
-    cursor = db[collection_name].find(filter_dict or {})
+    cursor = db[collection_name].find(filter_dict or {}, projection)
+    if sort:
+        cursor = cursor.sort(sort)
     if limit:
         cursor = cursor.limit(limit)
     
-    return list(cursor)
+    return cursor
+
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None, sort: list = None, projection: dict = None, db: AsyncIOMotorDatabase = None):
+    """Get documents from collection"""
+    cursor = find_documents(collection_name, filter_dict, limit, sort, projection, db=db)
+    return await cursor.to_list(length=limit)
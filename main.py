@@ -1,44 +1,160 @@
+import asyncio
+import logging
 import os
+import re
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+import orjson
 from pydantic import BaseModel
 
-from database import db, create_document, get_documents
-from schemas import Property, Booking
+from cache import bump_generation, cache_enabled, get_cached, get_generation, set_cached
+from database import create_document, create_documents, find_documents, get_db, get_documents
+from schemas import Booking, Property, PropertySummary
 from bson import ObjectId
+from pymongo import ASCENDING, TEXT, IndexModel
+from pymongo.errors import PyMongoError
 
 
-app = FastAPI(title="Villas & Farmhouses Rental API")
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_SECONDS = 60
+# Listing cache keys embed this namespace's generation; writes bump it to invalidate them
+PROPERTY_CACHE_NAMESPACE = "property"
+
+app = FastAPI(
+    title="Villas & Farmhouses Rental API",
+    default_response_class=ORJSONResponse,
+)
+
+# Comma-separated list of allowed origins; falls back to any origin when unset
+FRONTEND_ORIGINS = [o.strip() for o in os.getenv("FRONTEND_ORIGIN", "*").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=FRONTEND_ORIGINS,
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 
+PROPERTY_INDEXES = [
+    IndexModel([("property_type", ASCENDING), ("price_per_night", ASCENDING)]),
+    IndexModel([("bedrooms", ASCENDING)]),
+    IndexModel([("max_guests", ASCENDING)]),
+    IndexModel([("amenities", ASCENDING)]),
+    # Back the case-sensitive ^prefix search in list_properties
+    IndexModel([("title", ASCENDING)]),
+    IndexModel([("location", ASCENDING)]),
+    IndexModel([("country", ASCENDING)]),
+    IndexModel([("title", TEXT), ("location", TEXT), ("country", TEXT)]),
+]
+
+# Fields needed to render listing cards; detail views pass full=true
+LISTING_PROJECTION = {
+    field.alias or name: 1 for name, field in PropertySummary.model_fields.items()
+}
+LISTING_PROJECTION["images"] = {"$slice": 1}
+
+LISTING_RESPONSES = {
+    200: {
+        "model": List[PropertySummary],
+        "description": "Listing summaries. With full=true each item is instead the whole "
+        "property document, including description, host, all images and timestamps.",
+    }
+}
+
+
+@app.on_event("startup")
+async def ensure_indexes():
+    # create_indexes is idempotent, so this is safe to run on every boot
+    db = await get_db()
+    if db is None:
+        return
+    try:
+        await db["property"].create_indexes(PROPERTY_INDEXES)
+    except PyMongoError:
+        # Keep serving (and reporting via /test) even if Mongo is down at boot
+        logger.exception("Could not create property indexes")
+
+
+@app.on_event("startup")
+async def normalize_property_types():
+    # Listings filter property_type by exact lowercase match; bring older documents in line.
+    # Only documents that still differ are touched, so re-running is a no-op
+    db = await get_db()
+    if db is None:
+        return
+    normalized = {"$toLower": {"$trim": {"input": "$property_type"}}}
+    try:
+        result = await db["property"].update_many(
+            {
+                "property_type": {"$type": "string"},
+                "$expr": {"$ne": ["$property_type", normalized]},
+            },
+            [{"$set": {"property_type": normalized}}],
+        )
+    except PyMongoError:
+        logger.exception("Could not normalize property types")
+        return
+    if result.modified_count:
+        await bump_generation(PROPERTY_CACHE_NAMESPACE)
+
+
 # Helpers
 class IDResponse(BaseModel):
     id: str
 
 
+_is_object_id = re.compile(r"[0-9a-fA-F]{24}").fullmatch
+
+
+def _identity(v):
+    return v
+
+
+def _isoformat(v):
+    # Documents not written through create_document may hold None or strings here
+    return v.isoformat() if isinstance(v, datetime) else v
+
+
+# Per-field converters for the non-JSON BSON types our documents store
+_CONVERTERS = {
+    "_id": str,
+    "created_at": _isoformat,
+    "updated_at": _isoformat,
+}
+
+
 def serialize_doc(doc: dict):
     if not doc:
         return doc
-    result = {}
-    for k, v in doc.items():
-        if isinstance(v, ObjectId):
-            result[k] = str(v)
-        elif isinstance(v, datetime):
-            result[k] = v.isoformat()
-        else:
-            result[k] = v
-    return result
+    return {k: _CONVERTERS.get(k, _identity)(v) for k, v in doc.items()}
+
+
+async def _stream_json_array(head: bytes, cursor, parts: Optional[list]):
+    """Emit head, then the remaining cursor documents, as one JSON array"""
+    # parts, when given, collects the body for the cache write that runs after the response
+    yield head
+    async for doc in cursor:
+        chunk = b"," + orjson.dumps(serialize_doc(doc))
+        if parts is not None:
+            parts.append(chunk)
+        yield chunk
+    yield b"]"
+    # Only reached once the body has been fully sent, not on client disconnect
+    if parts is not None:
+        parts.append(b"]")
+
+
+async def _cache_streamed(cache_key: str, parts: list):
+    if parts[-1] == b"]":
+        await set_cached(cache_key, b"".join(parts), CACHE_TTL_SECONDS)
 
 
 @app.get("/")
@@ -52,12 +168,20 @@ def hello():
 
 
 @app.get("/test")
-def test_database():
+async def test_database(db=Depends(get_db)):
+    # Start the collection listing first so its round trip overlaps the env checks
+    collections_task = None
+    if db is not None:
+        collections_task = asyncio.ensure_future(db.list_collection_names())
+
+    database_url_status = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
+    database_name_status = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
-        "database_url": None,
-        "database_name": None,
+        "database_url": database_url_status,
+        "database_name": database_name_status,
         "connection_status": "Not Connected",
         "collections": [],
     }
@@ -65,13 +189,13 @@ def test_database():
     try:
         if db is not None:
             response["database"] = "✅ Available"
-            response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-            response["database_name"] = db.name if hasattr(db, "name") else "✅ Connected"
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await asyncio.wait_for(collections_task, timeout=1.0)
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
+            except asyncio.TimeoutError:
+                response["database"] = "⚠️  Connected but Error: timed out"
             except Exception as e:
                 response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
         else:
@@ -79,15 +203,12 @@ def test_database():
     except Exception as e:
         response["database"] = f"❌ Error: {str(e)[:50]}"
 
-    response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-    response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
-
     return response
 
 
 # Properties Endpoints
-@app.get("/api/properties")
-def list_properties(
+@app.get("/api/properties", responses=LISTING_RESPONSES)
+async def list_properties(
     q: Optional[str] = None,
     property_type: Optional[str] = Query(None, alias="type"),
     min_price: Optional[float] = None,
@@ -96,19 +217,35 @@ def list_properties(
     guests: Optional[int] = None,
     amenity: Optional[str] = None,
     limit: Optional[int] = Query(12, ge=1, le=50),
+    full: bool = Query(False, description="Return whole property documents instead of summaries"),
+    db=Depends(get_db),
 ):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
 
+    generation = await get_generation(PROPERTY_CACHE_NAMESPACE)
+    cache_key = f"list:{generation}:" + orjson.dumps(
+        [q, property_type, min_price, max_price, bedrooms, guests, amenity, limit, full]
+    ).decode()
+    cached = await get_cached(cache_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+
     flt = {}
-    if q:
+    sort = None
+    if q and q.startswith("^"):
+        # Anchored, case-sensitive prefix regexes can still use a B-tree index
+        prefix = f"^{re.escape(q[1:])}"
         flt["$or"] = [
-            {"title": {"$regex": q, "$options": "i"}},
-            {"location": {"$regex": q, "$options": "i"}},
-            {"country": {"$regex": q, "$options": "i"}},
+            {"title": {"$regex": prefix}},
+            {"location": {"$regex": prefix}},
+            {"country": {"$regex": prefix}},
         ]
+    elif q:
+        flt["$text"] = {"$search": q}
+        sort = [("score", {"$meta": "textScore"})]
     if property_type:
-        flt["property_type"] = {"$regex": f"^{property_type}$", "$options": "i"}
+        flt["property_type"] = property_type.strip().lower()
     price_range = {}
     if min_price is not None:
         price_range["$gte"] = float(min_price)
@@ -123,45 +260,75 @@ def list_properties(
     if amenity:
         flt["amenities"] = {"$in": [amenity]}
 
-    docs = get_documents("property", flt, limit)
-    return [serialize_doc(d) for d in docs]
-
-
-@app.get("/api/properties/featured")
-def featured_properties(limit: int = Query(8, ge=1, le=24)):
+    projection = None if full else LISTING_PROJECTION
+    cursor = find_documents("property", flt, limit, sort=sort, projection=projection, db=db)
+    # Run the query before any headers go out so query errors still surface as HTTP errors;
+    # with limit <= 50 the remaining documents arrive in the same first batch
+    try:
+        first = await cursor.next()
+    except StopAsyncIteration:
+        return Response(
+            b"[]",
+            media_type="application/json",
+            background=BackgroundTask(set_cached, cache_key, b"[]", CACHE_TTL_SECONDS),
+        )
+    head = b"[" + orjson.dumps(serialize_doc(first))
+    parts = [head] if cache_enabled() else None
+    return StreamingResponse(
+        _stream_json_array(head, cursor, parts),
+        media_type="application/json",
+        background=BackgroundTask(_cache_streamed, cache_key, parts) if parts is not None else None,
+    )
+
+
+@app.get("/api/properties/featured", responses=LISTING_RESPONSES)
+async def featured_properties(
+    limit: int = Query(8, ge=1, le=24),
+    full: bool = Query(False, description="Return whole property documents instead of summaries"),
+    db=Depends(get_db),
+):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    docs = get_documents("property", {}, limit)
-    return [serialize_doc(d) for d in docs]
+    generation = await get_generation(PROPERTY_CACHE_NAMESPACE)
+    cache_key = f"featured:{generation}:{limit}:{int(full)}"
+    cached = await get_cached(cache_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+
+    projection = None if full else LISTING_PROJECTION
+    docs = await get_documents("property", {}, limit, projection=projection, db=db)
+    payload = orjson.dumps([serialize_doc(d) for d in docs])
+    await set_cached(cache_key, payload, CACHE_TTL_SECONDS)
+    return Response(payload, media_type="application/json")
 
 
 @app.post("/api/properties", response_model=IDResponse)
-def create_property(prop: Property):
+async def create_property(prop: Property, db=Depends(get_db)):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    new_id = create_document("property", prop)
+    new_id = await create_document("property", prop, db=db)
+    await bump_generation(PROPERTY_CACHE_NAMESPACE)
     return {"id": new_id}
 
 
 @app.get("/api/properties/{property_id}")
-def get_property(property_id: str):
+async def get_property(property_id: str, db=Depends(get_db)):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    try:
-        doc = db["property"].find_one({"_id": ObjectId(property_id)})
-        if not doc:
-            raise HTTPException(status_code=404, detail="Property not found")
-        return serialize_doc(doc)
-    except Exception:
+    if not _is_object_id(property_id):
         raise HTTPException(status_code=400, detail="Invalid ID")
+    doc = await db["property"].find_one({"_id": ObjectId(property_id)})
+    if not doc:
+        raise HTTPException(status_code=404, detail="Property not found")
+    return serialize_doc(doc)
 
 
 # Bookings
 @app.post("/api/bookings", response_model=IDResponse)
-def create_booking(b: Booking):
+async def create_booking(b: Booking, db=Depends(get_db)):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    booking_id = create_document("booking", b)
+    booking_id = await create_document("booking", b, db=db)
     return {"id": booking_id}
 
 
@@ -170,244 +337,247 @@ class SeedResponse(BaseModel):
     inserted: int
 
 
+# Sample listings are validated once at import; the seed route only inserts them
+_SEED_SAMPLES: List[Property] = [
+    Property(
+        title="Skyline Luxe Villa",
+        description="A luxurious villa with panoramic city views and infinity pool.",
+        property_type="villa",
+        location="Mumbai",
+        country="India",
+        price_per_night=420,
+        max_guests=8,
+        bedrooms=4,
+        bathrooms=3,
+        amenities=["Pool", "WiFi", "Chef", "Parking", "Garden"],
+        images=[
+            "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
+            "https://images.unsplash.com/photo-1499951360447-b19be8fe80f5",
+        ],
+        host={"name": "Anaya Kapoor", "email": "anaya@example.com"},
+    ),
+    Property(
+        title="Serene Farm Retreat",
+        description="Peaceful farmhouse surrounded by lush fields and a private orchard.",
+        property_type="farmhouse",
+        location="Pune",
+        country="India",
+        price_per_night=220,
+        max_guests=6,
+        bedrooms=3,
+        bathrooms=2,
+        amenities=["Bonfire", "WiFi", "Parking", "Pet Friendly"],
+        images=[
+            "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267",
+            "https://images.unsplash.com/photo-1505691938895-1758d7feb511",
+        ],
+        host={"name": "Rohit Verma", "email": "rohit@example.com"},
+    ),
+    Property(
+        title="Modern Glass House",
+        description="Contemporary glass house tucked in the hills with stunning sunsets.",
+        property_type="villa",
+        location="Lonavala",
+        country="India",
+        price_per_night=350,
+        max_guests=5,
+        bedrooms=2,
+        bathrooms=2,
+        amenities=["Mountain View", "WiFi", "Hot Tub"],
+        images=[
+            "https://images.unsplash.com/photo-1494526585095-c41746248156",
+            "https://images.unsplash.com/photo-1499696010189-9d2150aee9f6",
+        ],
+        host={"name": "Mira Shah", "email": "mira@example.com"},
+    ),
+    Property(
+        title="Coastal Breeze Villa",
+        description="Minimal, modern villa steps from a quiet beach with sea breeze.",
+        property_type="villa",
+        location="Goa",
+        country="India",
+        price_per_night=300,
+        max_guests=7,
+        bedrooms=3,
+        bathrooms=3,
+        amenities=["Beach Access", "Pool", "AC", "WiFi"],
+        images=[
+            "https://images.unsplash.com/photo-1475855581690-80accde3ae2b",
+            "https://images.unsplash.com/photo-1505692794403-34fdb2f1faac",
+        ],
+        host={"name": "Elena Dsouza", "email": "elena@example.com"},
+    ),
+    Property(
+        title="Riverside Farmhouse",
+        description="Charming farmhouse along a riverside with sprawling lawns.",
+        property_type="farmhouse",
+        location="Karjat",
+        country="India",
+        price_per_night=180,
+        max_guests=6,
+        bedrooms=3,
+        bathrooms=2,
+        amenities=["Bonfire", "Parking", "Pet Friendly", "BBQ"],
+        images=[
+            "https://images.unsplash.com/photo-1505691938895-1758d7feb511",
+            "https://images.unsplash.com/photo-1460317442991-0ec209397118",
+        ],
+        host={"name": "Dev Patel", "email": "dev@example.com"},
+    ),
+    Property(
+        title="Forest Edge Cottage",
+        description="Cozy cottage at the forest edge; perfect for quiet retreats.",
+        property_type="cottage",
+        location="Coorg",
+        country="India",
+        price_per_night=160,
+        max_guests=4,
+        bedrooms=2,
+        bathrooms=1,
+        amenities=["Fireplace", "Mountain View", "WiFi"],
+        images=[
+            "https://images.unsplash.com/photo-1441974231531-c6227db76b6e",
+            "https://images.unsplash.com/photo-1502672260266-1c1ef2d93688",
+        ],
+        host={"name": "Aarav Nair", "email": "aarav@example.com"},
+    ),
+    Property(
+        title="Royal Heritage Mansion",
+        description="Grand mansion restored with modern comforts and private courtyard.",
+        property_type="mansion",
+        location="Jaipur",
+        country="India",
+        price_per_night=550,
+        max_guests=10,
+        bedrooms=6,
+        bathrooms=5,
+        amenities=["Chef", "Butler", "WiFi", "Parking", "Garden"],
+        images=[
+            "https://images.unsplash.com/photo-1501183638710-841dd1904471",
+            "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
+        ],
+        host={"name": "Rani Singh", "email": "rani@example.com"},
+    ),
+    Property(
+        title="Cliffside Infinity Villa",
+        description="Perched on a cliff with a dramatic infinity pool and sunset views.",
+        property_type="villa",
+        location="Visakhapatnam",
+        country="India",
+        price_per_night=480,
+        max_guests=8,
+        bedrooms=4,
+        bathrooms=4,
+        amenities=["Infinity Pool", "WiFi", "AC", "Chef"],
+        images=[
+            "https://images.unsplash.com/photo-1455587734955-081b22074882",
+            "https://images.unsplash.com/photo-1484154218962-a197022b5858",
+        ],
+        host={"name": "Kabir Rao", "email": "kabir@example.com"},
+    ),
+    Property(
+        title="Vineyard Country House",
+        description="Country farmhouse overlooking vineyards with rustic-chic interiors.",
+        property_type="farmhouse",
+        location="Nashik",
+        country="India",
+        price_per_night=210,
+        max_guests=5,
+        bedrooms=3,
+        bathrooms=2,
+        amenities=["Winery Tour", "Bonfire", "WiFi"],
+        images=[
+            "https://images.unsplash.com/photo-1496417263034-38ec4f0b665a",
+            "https://images.unsplash.com/photo-1505691938895-1758d7feb511",
+        ],
+        host={"name": "Neha Kulkarni", "email": "neha@example.com"},
+    ),
+    Property(
+        title="Lakeside Minimal Villa",
+        description="Ultra-minimal lakeside villa with floor-to-ceiling glass.",
+        property_type="villa",
+        location="Udaipur",
+        country="India",
+        price_per_night=390,
+        max_guests=6,
+        bedrooms=3,
+        bathrooms=3,
+        amenities=["Lake View", "WiFi", "Parking", "Chef"],
+        images=[
+            "https://images.unsplash.com/photo-1484154218962-a197022b5858",
+            "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
+        ],
+        host={"name": "Ishaan Mehta", "email": "ishaan@example.com"},
+    ),
+    Property(
+        title="Tea Estate Bungalow",
+        description="Colonial-era bungalow nestled within a working tea estate.",
+        property_type="cottage",
+        location="Munnar",
+        country="India",
+        price_per_night=190,
+        max_guests=5,
+        bedrooms=3,
+        bathrooms=2,
+        amenities=["Garden", "WiFi", "Bonfire"],
+        images=[
+            "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
+            "https://images.unsplash.com/photo-1449844908441-8829872d2607",
+        ],
+        host={"name": "Priya Iyer", "email": "priya@example.com"},
+    ),
+    Property(
+        title="Desert Dune Villa",
+        description="Stark, sculptural villa opening to desert dunes and starry skies.",
+        property_type="villa",
+        location="Jaisalmer",
+        country="India",
+        price_per_night=260,
+        max_guests=6,
+        bedrooms=3,
+        bathrooms=2,
+        amenities=["Rooftop", "WiFi", "AC", "BBQ"],
+        images=[
+            "https://images.unsplash.com/photo-1519710164239-da123dc03ef4",
+            "https://images.unsplash.com/photo-1499696010189-9d2150aee9f6",
+        ],
+        host={"name": "Zoya Khan", "email": "zoya@example.com"},
+    ),
+    Property(
+        title="Himalayan View Chalet",
+        description="Warm wooden chalet with sweeping Himalayan views and hot tub.",
+        property_type="cottage",
+        location="Manali",
+        country="India",
+        price_per_night=275,
+        max_guests=6,
+        bedrooms=3,
+        bathrooms=2,
+        amenities=["Mountain View", "Hot Tub", "Fireplace", "WiFi"],
+        images=[
+            "https://images.unsplash.com/photo-1512918728675-ed5a9ecdebfd",
+            "https://images.unsplash.com/photo-1502673530728-f79b4cab31b1",
+        ],
+        host={"name": "Arjun Malhotra", "email": "arjun@example.com"},
+    ),
+]
+
+_SEED_DOCS = [p.model_dump(mode="json", by_alias=True) for p in _SEED_SAMPLES]
+
+
 @app.post("/api/seed", response_model=SeedResponse)
-def seed_properties():
+async def seed_properties(db=Depends(get_db)):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
 
     # If we already have at least 10 properties, skip
-    count = db["property"].count_documents({})
+    # Collection metadata is accurate enough for this guard and avoids a scan
+    count = await db["property"].estimated_document_count()
     if count >= 10:
         return {"inserted": 0}
 
-    samples: List[Property] = [
-        Property(
-            title="Skyline Luxe Villa",
-            description="A luxurious villa with panoramic city views and infinity pool.",
-            property_type="villa",
-            location="Mumbai",
-            country="India",
-            price_per_night=420,
-            max_guests=8,
-            bedrooms=4,
-            bathrooms=3,
-            amenities=["Pool", "WiFi", "Chef", "Parking", "Garden"],
-            images=[
-                "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
-                "https://images.unsplash.com/photo-1499951360447-b19be8fe80f5",
-            ],
-            host={"name": "Anaya Kapoor", "email": "anaya@example.com"},
-        ),
-        Property(
-            title="Serene Farm Retreat",
-            description="Peaceful farmhouse surrounded by lush fields and a private orchard.",
-            property_type="farmhouse",
-            location="Pune",
-            country="India",
-            price_per_night=220,
-            max_guests=6,
-            bedrooms=3,
-            bathrooms=2,
-            amenities=["Bonfire", "WiFi", "Parking", "Pet Friendly"],
-            images=[
-                "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267",
-                "https://images.unsplash.com/photo-1505691938895-1758d7feb511",
-            ],
-            host={"name": "Rohit Verma", "email": "rohit@example.com"},
-        ),
-        Property(
-            title="Modern Glass House",
-            description="Contemporary glass house tucked in the hills with stunning sunsets.",
-            property_type="villa",
-            location="Lonavala",
-            country="India",
-            price_per_night=350,
-            max_guests=5,
-            bedrooms=2,
-            bathrooms=2,
-            amenities=["Mountain View", "WiFi", "Hot Tub"],
-            images=[
-                "https://images.unsplash.com/photo-1494526585095-c41746248156",
-                "https://images.unsplash.com/photo-1499696010189-9d2150aee9f6",
-            ],
-            host={"name": "Mira Shah", "email": "mira@example.com"},
-        ),
-        Property(
-            title="Coastal Breeze Villa",
-            description="Minimal, modern villa steps from a quiet beach with sea breeze.",
-            property_type="villa",
-            location="Goa",
-            country="India",
-            price_per_night=300,
-            max_guests=7,
-            bedrooms=3,
-            bathrooms=3,
-            amenities=["Beach Access", "Pool", "AC", "WiFi"],
-            images=[
-                "https://images.unsplash.com/photo-1475855581690-80accde3ae2b",
-                "https://images.unsplash.com/photo-1505692794403-34fdb2f1faac",
-            ],
-            host={"name": "Elena Dsouza", "email": "elena@example.com"},
-        ),
-        Property(
-            title="Riverside Farmhouse",
-            description="Charming farmhouse along a riverside with sprawling lawns.",
-            property_type="farmhouse",
-            location="Karjat",
-            country="India",
-            price_per_night=180,
-            max_guests=6,
-            bedrooms=3,
-            bathrooms=2,
-            amenities=["Bonfire", "Parking", "Pet Friendly", "BBQ"],
-            images=[
-                "https://images.unsplash.com/photo-1505691938895-1758d7feb511",
-                "https://images.unsplash.com/photo-1460317442991-0ec209397118",
-            ],
-            host={"name": "Dev Patel", "email": "dev@example.com"},
-        ),
-        Property(
-            title="Forest Edge Cottage",
-            description="Cozy cottage at the forest edge; perfect for quiet retreats.",
-            property_type="cottage",
-            location="Coorg",
-            country="India",
-            price_per_night=160,
-            max_guests=4,
-            bedrooms=2,
-            bathrooms=1,
-            amenities=["Fireplace", "Mountain View", "WiFi"],
-            images=[
-                "https://images.unsplash.com/photo-1441974231531-c6227db76b6e",
-                "https://images.unsplash.com/photo-1502672260266-1c1ef2d93688",
-            ],
-            host={"name": "Aarav Nair", "email": "aarav@example.com"},
-        ),
-        Property(
-            title="Royal Heritage Mansion",
-            description="Grand mansion restored with modern comforts and private courtyard.",
-            property_type="mansion",
-            location="Jaipur",
-            country="India",
-            price_per_night=550,
-            max_guests=10,
-            bedrooms=6,
-            bathrooms=5,
-            amenities=["Chef", "Butler", "WiFi", "Parking", "Garden"],
-            images=[
-                "https://images.unsplash.com/photo-1501183638710-841dd1904471",
-                "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
-            ],
-            host={"name": "Rani Singh", "email": "rani@example.com"},
-        ),
-        Property(
-            title="Cliffside Infinity Villa",
-            description="Perched on a cliff with a dramatic infinity pool and sunset views.",
-            property_type="villa",
-            location="Visakhapatnam",
-            country="India",
-            price_per_night=480,
-            max_guests=8,
-            bedrooms=4,
-            bathrooms=4,
-            amenities=["Infinity Pool", "WiFi", "AC", "Chef"],
-            images=[
-                "https://images.unsplash.com/photo-1455587734955-081b22074882",
-                "https://images.unsplash.com/photo-1484154218962-a197022b5858",
-            ],
-            host={"name": "Kabir Rao", "email": "kabir@example.com"},
-        ),
-        Property(
-            title="Vineyard Country House",
-            description="Country farmhouse overlooking vineyards with rustic-chic interiors.",
-            property_type="farmhouse",
-            location="Nashik",
-            country="India",
-            price_per_night=210,
-            max_guests=5,
-            bedrooms=3,
-            bathrooms=2,
-            amenities=["Winery Tour", "Bonfire", "WiFi"],
-            images=[
-                "https://images.unsplash.com/photo-1496417263034-38ec4f0b665a",
-                "https://images.unsplash.com/photo-1505691938895-1758d7feb511",
-            ],
-            host={"name": "Neha Kulkarni", "email": "neha@example.com"},
-        ),
-        Property(
-            title="Lakeside Minimal Villa",
-            description="Ultra-minimal lakeside villa with floor-to-ceiling glass.",
-            property_type="villa",
-            location="Udaipur",
-            country="India",
-            price_per_night=390,
-            max_guests=6,
-            bedrooms=3,
-            bathrooms=3,
-            amenities=["Lake View", "WiFi", "Parking", "Chef"],
-            images=[
-                "https://images.unsplash.com/photo-1484154218962-a197022b5858",
-                "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
-            ],
-            host={"name": "Ishaan Mehta", "email": "ishaan@example.com"},
-        ),
-        Property(
-            title="Tea Estate Bungalow",
-            description="Colonial-era bungalow nestled within a working tea estate.",
-            property_type="cottage",
-            location="Munnar",
-            country="India",
-            price_per_night=190,
-            max_guests=5,
-            bedrooms=3,
-            bathrooms=2,
-            amenities=["Garden", "WiFi", "Bonfire"],
-            images=[
-                "https://images.unsplash.com/photo-1505691723518-36a5ac3b2d98",
-                "https://images.unsplash.com/photo-1449844908441-8829872d2607",
-            ],
-            host={"name": "Priya Iyer", "email": "priya@example.com"},
-        ),
-        Property(
-            title="Desert Dune Villa",
-            description="Stark, sculptural villa opening to desert dunes and starry skies.",
-            property_type="villa",
-            location="Jaisalmer",
-            country="India",
-            price_per_night=260,
-            max_guests=6,
-            bedrooms=3,
-            bathrooms=2,
-            amenities=["Rooftop", "WiFi", "AC", "BBQ"],
-            images=[
-                "https://images.unsplash.com/photo-1519710164239-da123dc03ef4",
-                "https://images.unsplash.com/photo-1499696010189-9d2150aee9f6",
-            ],
-            host={"name": "Zoya Khan", "email": "zoya@example.com"},
-        ),
-        Property(
-            title="Himalayan View Chalet",
-            description="Warm wooden chalet with sweeping Himalayan views and hot tub.",
-            property_type="cottage",
-            location="Manali",
-            country="India",
-            price_per_night=275,
-            max_guests=6,
-            bedrooms=3,
-            bathrooms=2,
-            amenities=["Mountain View", "Hot Tub", "Fireplace", "WiFi"],
-            images=[
-                "https://images.unsplash.com/photo-1512918728675-ed5a9ecdebfd",
-                "https://images.unsplash.com/photo-1502673530728-f79b4cab31b1",
-            ],
-            host={"name": "Arjun Malhotra", "email": "arjun@example.com"},
-        ),
-    ]
-
-    inserted = 0
-    for s in samples:
-        create_document("property", s)
-        inserted += 1
+    inserted = await create_documents("property", _SEED_DOCS, db=db)
+    await bump_generation(PROPERTY_CACHE_NAMESPACE)
     return {"inserted": inserted}
 
 
@@ -415,4 +585,12 @@ if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="auto",
+        http="httptools",
+        workers=workers,
+    )
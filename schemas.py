@@ -5,17 +5,40 @@ Each Pydantic model represents a MongoDB collection. The collection name is the
 lowercase of the class name (e.g., Property -> "property").
 """
 
+import re
 from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, field_validator
+
+# Cheap shape check for trusted data; untrusted input still uses EmailStr
+_email_match = re.compile(r"^[^@]+@[^@]+\.[^@]+$").match
+
+# Request bodies are built once and only read afterwards
+_read_only_config = ConfigDict(
+    frozen=True,
+    extra="ignore",
+    validate_assignment=False,
+    str_strip_whitespace=True,
+)
 
 
 class Host(BaseModel):
+    model_config = _read_only_config
+
     name: str = Field(..., description="Host full name")
-    email: EmailStr = Field(..., description="Host contact email")
+    email: str = Field(..., description="Host contact email")
     phone: Optional[str] = Field(None, description="Host phone number")
 
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, v: str) -> str:
+        if not _email_match(v):
+            raise ValueError("value is not a valid email address")
+        return v
+
 
 class Property(BaseModel):
+    model_config = _read_only_config
+
     title: str = Field(..., description="Listing title")
     description: Optional[str] = Field(None, description="Detailed description")
     property_type: str = Field(..., description="villa | farmhouse | cottage | mansion")
@@ -30,8 +53,34 @@ class Property(BaseModel):
     rating: Optional[float] = Field(None, ge=0, le=5, description="Average rating")
     host: Host = Field(..., description="Host details")
 
+    @field_validator("property_type")
+    @classmethod
+    def normalize_property_type(cls, v: str) -> str:
+        # Stored lowercase so listings can filter with an indexed equality match
+        return v.strip().lower()
+
+
+class PropertySummary(BaseModel):
+    """Card-sized view of a Property returned by the listing endpoints"""
+    model_config = _read_only_config
+
+    id: str = Field(..., alias="_id", description="Property ID")
+    title: str
+    location: str
+    country: str
+    price_per_night: float
+    max_guests: int
+    bedrooms: int
+    bathrooms: int
+    property_type: str
+    amenities: List[str] = Field(default_factory=list)
+    images: List[str] = Field(default_factory=list, description="First image URL only")
+    rating: Optional[float] = None
+
 
 class Booking(BaseModel):
+    model_config = _read_only_config
+
     property_id: str = Field(..., description="ID of the property being booked")
     guest_name: str = Field(..., description="Guest full name")
     guest_email: EmailStr = Field(..., description="Guest email")